@@ -4,14 +4,40 @@ Pipeline Monitoring Dashboard
 Simple web server that displays tasks.json structure and live logs
 """
 
+import gzip
 import json
+import mmap
 import os
 import time
 import threading
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 
+# Optional: orjson serializes straight to bytes in native code, 3-5x
+# faster than the stdlib on tasks.json-sized payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Optional: watchdog gives us inotify-backed invalidation so cache checks
+# skip the per-request stat() entirely; without it we fall back to
+# stat-based change tokens
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
 # Configuration
 PORT = 8888
 PROJECT_ROOT = os.getcwd()
@@ -19,6 +45,202 @@ TASKS_FILE = os.path.join(PROJECT_ROOT, '.taskmaster', 'tasks', 'tasks.json')
 LOG_FILE = os.path.join(PROJECT_ROOT, '.taskmaster', 'pipeline.log')
 MONITOR_DIR = os.path.join(os.path.dirname(__file__), 'monitor')
 
+# The dashboard page lives in monitor/index.html so it can be edited
+# without touching this module. Map it read-only at startup: serving is
+# then a single page-cache-backed buffer write, with a gzipped copy
+# compressed once for clients that accept it.
+_HTML_PATH = os.path.join(MONITOR_DIR, 'index.html')
+with open(_HTML_PATH, 'rb') as _f:
+    _HTML_BYTES = mmap.mmap(_f.fileno(), 0, access=mmap.ACCESS_READ)
+_HTML_GZ = gzip.compress(_HTML_BYTES, 6)
+
+# Zero-copy view split after </head>: the head is flushed first so the
+# browser starts fetching the CSS/CDN script while the body streams
+_HTML_VIEW = memoryview(_HTML_BYTES)
+_HTML_HEAD_END = _HTML_BYTES.find(b'</head>') + len(b'</head>')
+
+# In-memory payload caches keyed by each file's change token, so polls
+# against an unchanged file cost a stat() instead of a read + reparse
+_cache_lock = threading.Lock()
+_tasks_cache = {'key': (), 'payload': b'', 'gz': b''}
+_logs_cache = {'key': (), 'payload': b''}
+
+# Dirty flags flipped by the file watcher; start set so the first
+# request populates the caches. Only consulted while a watcher is live.
+_tasks_dirty = threading.Event()
+_tasks_dirty.set()
+_logs_dirty = threading.Event()
+_logs_dirty.set()
+_watcher_active = False
+
+def _file_token(path):
+    """Change token for a file: (mtime_ns, size), or None if missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _tasks_payload():
+    """Return (token, encoded tasks.json, gzipped copy), re-reading only on change"""
+    if _watcher_active and not _tasks_dirty.is_set():
+        with _cache_lock:
+            return _tasks_cache['key'], _tasks_cache['payload'], _tasks_cache['gz']
+
+    # Clear before the stat so a write landing mid-read re-dirties us
+    _tasks_dirty.clear()
+    key = _file_token(TASKS_FILE)
+    with _cache_lock:
+        if key == _tasks_cache['key']:
+            return key, _tasks_cache['payload'], _tasks_cache['gz']
+
+    if key is None:
+        # Empty structure if file doesn't exist
+        tasks_data = {"master": {"tasks": []}}
+    else:
+        with open(TASKS_FILE, 'rb') as f:
+            tasks_data = _json_loads(f.read())
+    payload = _json_dumps(tasks_data)
+    payload_gz = gzip.compress(payload, 6)
+
+    with _cache_lock:
+        _tasks_cache['key'] = key
+        _tasks_cache['payload'] = payload
+        _tasks_cache['gz'] = payload_gz
+    return key, payload, payload_gz
+
+def _tail_lines(path, count, chunk=16384):
+    """Last `count` lines of a file as bytes, without reading the whole file.
+
+    Seeks to a chunk before EOF and splits just that block (the classic
+    `tail -n` trick); doubles the chunk if too few lines landed in it.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        while True:
+            start = max(0, end - chunk)
+            f.seek(start)
+            tail = f.read()
+            lines = tail.splitlines(keepends=True)
+            if start == 0 or len(lines) > count:
+                break
+            chunk *= 2
+    if start > 0 and lines:
+        # First line may be a partial one cut by the seek — drop it
+        lines = lines[1:]
+    return b''.join(lines[-count:])
+
+def _start_file_watcher():
+    """Watch .taskmaster/ so caches re-read only after an actual write.
+
+    Returns the running Observer, or None when watchdog isn't installed
+    or the directory doesn't exist yet — callers then just keep the
+    stat-based fallback.
+    """
+    global _watcher_active
+
+    watch_dir = os.path.dirname(LOG_FILE)
+    if Observer is None or not os.path.isdir(watch_dir):
+        return None
+
+    class _DirtyMarker(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # dest_path covers atomic rename-into-place writes
+            path = getattr(event, 'dest_path', '') or event.src_path
+            if path.endswith(os.path.basename(TASKS_FILE)):
+                _tasks_dirty.set()
+            elif path.endswith(os.path.basename(LOG_FILE)):
+                _logs_dirty.set()
+
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(_DirtyMarker(), watch_dir, recursive=True)
+    observer.start()
+    _watcher_active = True
+    return observer
+
+def _wait_for_change(path, token, timeout):
+    """Block until the file's change token moves or `timeout` seconds pass.
+
+    Lets /api/tasks and /api/logs long-poll: the handler thread hangs
+    here instead of the client re-requesting on a fixed interval.
+    """
+    deadline = time.monotonic() + min(timeout, 30)
+    while time.monotonic() < deadline:
+        if _file_token(path) != token:
+            break
+        time.sleep(0.1)
+
+def _tasks_tag(key):
+    """Client-visible tag for a tasks change token"""
+    return f"{key[0]:x}-{key[1]:x}" if key else "missing"
+
+def _log_span(since):
+    """Clamp `since` to the log file and return the (start, end) byte span"""
+    try:
+        size = os.path.getsize(LOG_FILE)
+    except OSError:
+        return 0, 0
+    if since > size:
+        since = 0  # log was truncated or rotated; resend from the top
+    return since, size
+
+def _log_delta(since):
+    """Return (bytes appended after `since`, new offset) for the log file"""
+    start, end = _log_span(since)
+    if start == end:
+        return b'', end
+    with open(LOG_FILE, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+        return data, end
+
+def _send_file_range(wfile, f, offset, count):
+    """Copy `count` bytes of `f` starting at `offset` to the response.
+
+    os.sendfile moves page-cache data straight to the socket in the
+    kernel — no userspace copy; platforms without it (or sockets that
+    refuse it) fall back to a plain seek + read + write.
+    """
+    wfile.flush()  # headers out before the kernel takes over
+    if hasattr(os, 'sendfile'):
+        sent = 0
+        try:
+            while sent < count:
+                n = os.sendfile(wfile.fileno(), f.fileno(), offset + sent, count - sent)
+                if n == 0:
+                    break
+                sent += n
+            return
+        except OSError:
+            if sent:
+                raise  # mid-transfer failure; can't cleanly restart
+    f.seek(offset)
+    wfile.write(f.read(count))
+
+def _logs_payload():
+    """Return (token, last 100 log lines as bytes), cached by change token"""
+    if _watcher_active and not _logs_dirty.is_set():
+        with _cache_lock:
+            return _logs_cache['key'], _logs_cache['payload']
+
+    _logs_dirty.clear()
+    key = _file_token(LOG_FILE)
+    with _cache_lock:
+        if key == _logs_cache['key']:
+            return key, _logs_cache['payload']
+
+    if key is None:
+        payload = b"No logs available yet.\n"
+    else:
+        payload = _tail_lines(LOG_FILE, 100)
+
+    with _cache_lock:
+        _logs_cache['key'] = key
+        _logs_cache['payload'] = payload
+    return key, payload
+
 class DashboardHandler(SimpleHTTPRequestHandler):
     """Custom handler for dashboard requests"""
 
@@ -32,527 +254,216 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.serve_tasks_json()
         elif parsed_path.path == '/api/logs':
             self.serve_logs()
+        elif parsed_path.path == '/api/events':
+            self.serve_events()
+        elif parsed_path.path == '/api/snapshot':
+            self.serve_snapshot()
         elif parsed_path.path == '/api/status':
             self.serve_status()
         else:
             super().do_GET()
 
     def serve_dashboard(self):
-        """Serve the main dashboard HTML"""
-        html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Pipeline Monitor</title>
-    <script src="https://unpkg.com/vis-network@9.1.2/standalone/umd/vis-network.min.js"></script>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Courier New', monospace;
-            background: #1e1e1e;
-            color: #d4d4d4;
-            height: 100vh;
-            overflow: hidden;
-        }
-
-        #header {
-            background: #252526;
-            padding: 15px 20px;
-            border-bottom: 1px solid #3e3e42;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        #header h1 {
-            font-size: 18px;
-            font-weight: 600;
-            color: #4ec9b0;
-        }
-
-        #status {
-            display: flex;
-            gap: 20px;
-            font-size: 12px;
-        }
-
-        .status-item {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .status-dot {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-        }
-
-        .status-dot.active {
-            background: #4ec9b0;
-            box-shadow: 0 0 8px #4ec9b0;
-        }
-
-        .status-dot.inactive {
-            background: #666;
-        }
-
-        #container {
-            display: flex;
-            height: calc(100vh - 51px);
-        }
-
-        #left-panel {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            border-right: 1px solid #3e3e42;
-        }
-
-        #right-panel {
-            width: 500px;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .panel-header {
-            background: #2d2d30;
-            padding: 10px 15px;
-            font-size: 12px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            color: #999;
-            border-bottom: 1px solid #3e3e42;
-        }
-
-        #graph {
-            flex: 1;
-            background: #1e1e1e;
-        }
-
-        #task-list {
-            flex: 1;
-            overflow-y: auto;
-            padding: 15px;
-        }
-
-        .master-task {
-            margin-bottom: 20px;
-            background: #252526;
-            border-radius: 4px;
-            border: 1px solid #3e3e42;
-        }
-
-        .master-task-header {
-            padding: 12px 15px;
-            font-weight: 600;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            cursor: pointer;
-            user-select: none;
-        }
-
-        .master-task-header:hover {
-            background: #2d2d30;
-        }
-
-        .task-name {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-
-        .task-status {
-            font-size: 10px;
-            padding: 3px 8px;
-            border-radius: 3px;
-            text-transform: uppercase;
-            font-weight: 600;
-        }
-
-        .task-status.pending {
-            background: #3e3e42;
-            color: #999;
-        }
-
-        .task-status.in-progress {
-            background: #1a472a;
-            color: #4ec9b0;
-        }
-
-        .task-status.complete {
-            background: #1a472a;
-            color: #6fc89f;
-        }
-
-        .subtask-list {
-            padding: 0 15px 12px 15px;
-            display: none;
-        }
-
-        .master-task.expanded .subtask-list {
-            display: block;
-        }
-
-        .subtask {
-            padding: 8px 12px;
-            margin: 4px 0;
-            background: #1e1e1e;
-            border-radius: 3px;
-            font-size: 13px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .subtask:hover {
-            background: #2d2d30;
-        }
-
-        #logs {
-            flex: 1;
-            background: #1e1e1e;
-            overflow-y: auto;
-            padding: 15px;
-            font-size: 12px;
-            line-height: 1.6;
-        }
-
-        .log-line {
-            padding: 2px 0;
-            font-family: 'SF Mono', monospace;
-        }
-
-        .log-line.error {
-            color: #f48771;
-        }
-
-        .log-line.warning {
-            color: #dcdcaa;
-        }
-
-        .log-line.success {
-            color: #4ec9b0;
-        }
-
-        .log-line.info {
-            color: #9cdcfe;
-        }
-
-        #stats {
-            padding: 15px;
-            background: #252526;
-            border-top: 1px solid #3e3e42;
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 15px;
-            font-size: 11px;
-        }
-
-        .stat {
-            text-align: center;
-        }
-
-        .stat-value {
-            font-size: 24px;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-
-        .stat-label {
-            color: #999;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        .expand-icon {
-            transition: transform 0.2s;
-        }
-
-        .master-task.expanded .expand-icon {
-            transform: rotate(90deg);
-        }
-
-        /* Scrollbar styling */
-        ::-webkit-scrollbar {
-            width: 10px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: #1e1e1e;
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: #3e3e42;
-            border-radius: 5px;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: #4e4e52;
-        }
-    </style>
-</head>
-<body>
-    <div id="header">
-        <h1>🔄 Pipeline Monitor</h1>
-        <div id="status">
-            <div class="status-item">
-                <div class="status-dot active" id="status-indicator"></div>
-                <span id="status-text">Monitoring</span>
-            </div>
-            <div class="status-item">
-                <span id="update-time">Last update: --:--:--</span>
-            </div>
-        </div>
-    </div>
-
-    <div id="container">
-        <div id="left-panel">
-            <div class="panel-header">Task Hierarchy</div>
-            <div id="task-list"></div>
-            <div id="stats">
-                <div class="stat">
-                    <div class="stat-value" id="total-tasks">0</div>
-                    <div class="stat-label">Master Tasks</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" id="total-subtasks">0</div>
-                    <div class="stat-label">Subtasks</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" id="completed-tasks">0</div>
-                    <div class="stat-label">Completed</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value" id="progress">0%</div>
-                    <div class="stat-label">Progress</div>
-                </div>
-            </div>
-        </div>
-
-        <div id="right-panel">
-            <div class="panel-header">Live Logs</div>
-            <div id="logs"></div>
-        </div>
-    </div>
-
-    <script>
-        let logsContainer = document.getElementById('logs');
-        let taskListContainer = document.getElementById('task-list');
-        let logLines = [];
-        let autoScroll = true;
-
-        // Check if logs should auto-scroll
-        logsContainer.addEventListener('scroll', () => {
-            const isAtBottom = logsContainer.scrollHeight - logsContainer.scrollTop <= logsContainer.clientHeight + 50;
-            autoScroll = isAtBottom;
-        });
-
-        // Fetch and display tasks
-        async function fetchTasks() {
-            try {
-                const response = await fetch('/api/tasks');
-                const data = await response.json();
-
-                if (data.master && data.master.tasks) {
-                    renderTasks(data.master.tasks);
-                    updateStats(data.master.tasks);
-                }
-
-                updateTimestamp();
-            } catch (error) {
-                console.error('Error fetching tasks:', error);
-            }
-        }
-
-        function renderTasks(tasks) {
-            taskListContainer.innerHTML = '';
-
-            tasks.forEach(task => {
-                const taskDiv = document.createElement('div');
-                taskDiv.className = 'master-task';
-
-                const status = getTaskStatus(task);
-
-                taskDiv.innerHTML = `
-                    <div class="master-task-header">
-                        <div class="task-name">
-                            <span class="expand-icon">▶</span>
-                            <span>Task ${task.id}: ${task.name}</span>
-                        </div>
-                        <span class="task-status ${status}">${status}</span>
-                    </div>
-                    <div class="subtask-list">
-                        ${renderSubtasks(task.subtasks || [])}
-                    </div>
-                `;
-
-                taskDiv.querySelector('.master-task-header').addEventListener('click', () => {
-                    taskDiv.classList.toggle('expanded');
-                });
-
-                taskListContainer.appendChild(taskDiv);
-            });
-        }
-
-        function renderSubtasks(subtasks) {
-            return subtasks.map(subtask => {
-                const status = subtask.status || 'pending';
-                return `
-                    <div class="subtask">
-                        <span>${subtask.id}. ${subtask.title}</span>
-                        <span class="task-status ${status}">${status}</span>
-                    </div>
-                `;
-            }).join('');
-        }
-
-        function getTaskStatus(task) {
-            if (!task.subtasks || task.subtasks.length === 0) {
-                return task.status || 'pending';
-            }
-
-            const allComplete = task.subtasks.every(st => st.status === 'complete');
-            const anyInProgress = task.subtasks.some(st => st.status === 'in-progress');
-
-            if (allComplete) return 'complete';
-            if (anyInProgress) return 'in-progress';
-            return 'pending';
-        }
-
-        function updateStats(tasks) {
-            const totalTasks = tasks.length;
-            const totalSubtasks = tasks.reduce((sum, task) => sum + (task.subtasks?.length || 0), 0);
-
-            let completedSubtasks = 0;
-            tasks.forEach(task => {
-                if (task.subtasks) {
-                    completedSubtasks += task.subtasks.filter(st => st.status === 'complete').length;
-                }
-            });
-
-            const progress = totalSubtasks > 0 ? Math.round((completedSubtasks / totalSubtasks) * 100) : 0;
-
-            document.getElementById('total-tasks').textContent = totalTasks;
-            document.getElementById('total-subtasks').textContent = totalSubtasks;
-            document.getElementById('completed-tasks').textContent = completedSubtasks;
-            document.getElementById('progress').textContent = progress + '%';
-        }
-
-        // Fetch and display logs
-        async function fetchLogs() {
-            try {
-                const response = await fetch('/api/logs');
-                const text = await response.text();
-
-                if (text) {
-                    const lines = text.split('\\n').filter(line => line.trim());
-
-                    // Only add new lines
-                    const newLines = lines.slice(logLines.length);
-                    logLines = lines;
-
-                    newLines.forEach(line => {
-                        const logDiv = document.createElement('div');
-                        logDiv.className = 'log-line';
-
-                        // Color code based on content
-                        if (line.includes('ERROR') || line.includes('❌')) {
-                            logDiv.className += ' error';
-                        } else if (line.includes('WARNING') || line.includes('⚠️')) {
-                            logDiv.className += ' warning';
-                        } else if (line.includes('SUCCESS') || line.includes('✅')) {
-                            logDiv.className += ' success';
-                        } else if (line.includes('INFO') || line.includes('ℹ️')) {
-                            logDiv.className += ' info';
-                        }
-
-                        logDiv.textContent = line;
-                        logsContainer.appendChild(logDiv);
-                    });
-
-                    // Auto-scroll if user is at bottom
-                    if (autoScroll) {
-                        logsContainer.scrollTop = logsContainer.scrollHeight;
-                    }
-
-                    // Limit log lines to prevent memory issues
-                    while (logsContainer.children.length > 1000) {
-                        logsContainer.removeChild(logsContainer.firstChild);
-                    }
-                }
-            } catch (error) {
-                console.error('Error fetching logs:', error);
-            }
-        }
-
-        function updateTimestamp() {
-            const now = new Date();
-            const timeStr = now.toLocaleTimeString();
-            document.getElementById('update-time').textContent = `Last update: ${timeStr}`;
-        }
-
-        // Initial load
-        fetchTasks();
-        fetchLogs();
-
-        // Poll for updates
-        setInterval(fetchTasks, 2000);  // Update tasks every 2 seconds
-        setInterval(fetchLogs, 500);    // Update logs every 0.5 seconds
-    </script>
-</body>
-</html>"""
+        """Serve the main dashboard HTML, gzipped when the client accepts it"""
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = _HTML_GZ if use_gzip else _HTML_BYTES
 
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+
+        if use_gzip:
+            # Already ~4 KB; one write is a single TCP segment or two
+            self.wfile.write(body)
+            return
+
+        # Flush the <head> on its own so parsing (and the vis-network
+        # CDN fetch) overlaps with the rest of the transfer
+        self.wfile.write(_HTML_VIEW[:_HTML_HEAD_END])
+        self.wfile.flush()
+        self.wfile.write(_HTML_VIEW[_HTML_HEAD_END:])
 
     def serve_tasks_json(self):
-        """Serve tasks.json content"""
+        """Serve tasks.json content, long-polling when ?wait= is given"""
         try:
-            if os.path.exists(TASKS_FILE):
-                with open(TASKS_FILE, 'r') as f:
-                    tasks_data = json.load(f)
-            else:
-                # Return empty structure if file doesn't exist
-                tasks_data = {"master": {"tasks": []}}
+            qs = parse_qs(urlparse(self.path).query)
+            wait = float(qs.get('wait', ['0'])[0])
+            if wait:
+                _wait_for_change(TASKS_FILE, _file_token(TASKS_FILE), wait)
+
+            key, payload, payload_gz = _tasks_payload()
+
+            # ETag from the change token: a matching If-None-Match means
+            # the client already has this exact payload — send no body
+            etag = f'"{_tasks_tag(key)}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = payload_gz if use_gzip else payload
 
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('ETag', etag)
             self.send_header('Access-Control-Allow-Origin', '*')
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(json.dumps(tasks_data).encode())
+            self.wfile.write(body)
         except Exception as e:
             self.send_error(500, f'Error reading tasks: {str(e)}')
 
     def serve_logs(self):
-        """Serve last N lines of log file"""
+        """Serve the log tail, or only appended bytes when ?since= is given.
+
+        Clients echo back the X-Log-Offset header from the previous
+        response, so steady-state polls carry only actual log growth.
+        """
         try:
-            if os.path.exists(LOG_FILE):
-                # Read last 100 lines
-                with open(LOG_FILE, 'r') as f:
-                    lines = f.readlines()
-                    last_lines = ''.join(lines[-100:])
-            else:
-                last_lines = "No logs available yet.\n"
+            qs = parse_qs(urlparse(self.path).query)
+            wait = float(qs.get('wait', ['0'])[0])
+
+            if 'since' in qs:
+                since = int(qs['since'][0])
+                start, end = _log_span(since)
+                if wait and start == end:
+                    _wait_for_change(LOG_FILE, _file_token(LOG_FILE), wait)
+                    start, end = _log_span(since)
+
+                self.send_response(200)
+                self.send_header('Content-type', 'text/plain')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('X-Log-Offset', str(end))
+                self.send_header('Content-Length', str(end - start))
+                self.end_headers()
+                if end > start:
+                    # Known byte range: hand it to the kernel zero-copy
+                    with open(LOG_FILE, 'rb') as f:
+                        _send_file_range(self.wfile, f, start, end - start)
+                return
+
+            if wait:
+                _wait_for_change(LOG_FILE, _file_token(LOG_FILE), wait)
+            key, payload = _logs_payload()
+            offset = key[1] if key else 0
 
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
             self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('X-Log-Offset', str(offset))
+            self.send_header('Content-Length', str(len(payload)))
             self.end_headers()
-            self.wfile.write(last_lines.encode())
+            self.wfile.write(payload)
         except Exception as e:
             self.send_error(500, f'Error reading logs: {str(e)}')
 
+    def serve_snapshot(self):
+        """Serve tasks plus the log delta as one JSON payload.
+
+        The polling fallback drives both panels off this endpoint, so a
+        cycle costs one request instead of two. `since` is the log byte
+        offset; `tasks_tag` echoes the tag from the previous snapshot so
+        ?wait= can hang until either file actually changes.
+        """
+        try:
+            qs = parse_qs(urlparse(self.path).query)
+            since = int(qs.get('since', ['0'])[0])
+            wait = float(qs.get('wait', ['0'])[0])
+            client_tag = qs.get('tasks_tag', [''])[0]
+
+            if wait:
+                deadline = time.monotonic() + min(wait, 30)
+                while time.monotonic() < deadline:
+                    start, end = _log_span(since)
+                    if start != end or _tasks_tag(_file_token(TASKS_FILE)) != client_tag:
+                        break
+                    time.sleep(0.1)
+
+            key, tasks_raw, _ = _tasks_payload()
+            if since:
+                log_data, log_offset = _log_delta(since)
+            else:
+                # Fresh client: recent tail, deltas from there on
+                log_key, log_data = _logs_payload()
+                log_offset = log_key[1] if log_key else 0
+
+            # Splice the cached tasks bytes in verbatim — no reparse
+            body = b''.join([
+                b'{"tasks":', tasks_raw,
+                b',"tasks_tag":', _json_dumps(_tasks_tag(key)),
+                b',"logs":', _json_dumps(log_data.decode('utf-8', 'replace')),
+                b',"log_offset":', str(log_offset).encode(),
+                b'}',
+            ])
+
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except Exception as e:
+            self.send_error(500, f'Error building snapshot: {str(e)}')
+
+    def serve_events(self):
+        """Stream task and log updates as Server-Sent Events.
+
+        Pushes a `tasks` or `logs` event only when the underlying file's
+        (mtime, size) change token moves, so idle pipelines cost nothing
+        on the wire. `/api/tasks` and `/api/logs` stay available as plain
+        fallbacks for curl and older browsers.
+        """
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        # Sentinel tokens so the first pass always emits current state
+        tasks_token = ()
+        log_token = ()
+        log_offset = 0
+
+        try:
+            while True:
+                try:
+                    new_token, payload, _ = _tasks_payload()
+                except (OSError, ValueError):
+                    new_token = tasks_token  # file mid-write; retry next cycle
+                if new_token != tasks_token:
+                    tasks_token = new_token
+                    self.wfile.write(b"event: tasks\ndata: " + payload + b"\n\n")
+                    self.wfile.flush()
+
+                try:
+                    new_token, payload = _logs_payload()
+                except OSError:
+                    new_token = log_token
+                if new_token != log_token:
+                    if log_token == ():
+                        # First pass: recent tail, then deltas from here on
+                        data = payload
+                        log_offset = new_token[1] if new_token else 0
+                    else:
+                        data, log_offset = _log_delta(log_offset)
+                    log_token = new_token
+                    if data:
+                        body = b''.join(b"data: " + line + b"\n"
+                                        for line in data.splitlines())
+                        self.wfile.write(b"event: logs\n" + body + b"\n")
+                        self.wfile.flush()
+
+                time.sleep(0.5)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client disconnected
+
     def serve_status(self):
         """Serve pipeline status"""
         status = {
@@ -565,7 +476,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(status).encode())
+        self.wfile.write(_json_dumps(status))
 
     def log_message(self, format, *args):
         """Suppress default logging"""
@@ -584,7 +495,13 @@ def main():
     print(f"\n✨ Open your browser to: http://localhost:{PORT}")
     print("\n💡 Press Ctrl+C to stop the server\n")
 
-    server = HTTPServer(('localhost', PORT), DashboardHandler)
+    # Threaded server: each request gets its own thread, so a hung SSE
+    # stream or a slow tasks.json read never blocks other clients
+    server = ThreadingHTTPServer(('localhost', PORT), DashboardHandler)
+    server.daemon_threads = True  # don't let pollers hold up Ctrl+C
+
+    if _start_file_watcher():
+        print("👀 File watching active (inotify via watchdog)\n")
 
     try:
         server.serve_forever()